@@ -1,9 +1,20 @@
 #!/usr/bin/env python
 import os
+import signal
+import sys
 from pathlib import Path
 from pysembench.core import Sembench, locations_from_environ
 
 
+def _exit_on_signal(signum, frame):
+    """Turns docker/k8s stop requests into a regular SystemExit"""
+    # note: as PID 1 in the container the default SIGTERM action is ignored,
+    #   so without this `docker stop` only ends us after the SIGKILL timeout
+    sys.exit(128 + signum)
+
+
+signal.signal(signal.SIGTERM, _exit_on_signal)
+
 sb = Sembench(
     locations=locations_from_environ(),
     sembench_config_path=os.getenv("SEMBENCH_CONFIG_PATH"),